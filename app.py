@@ -1,23 +1,23 @@
 import streamlit as st
-import pandas as pd
 import json
 import os
-from datetime import datetime, timedelta
-import requests
-from typing import Dict, List, Any, Optional
+from datetime import datetime
 
 # Add parent directory to path for imports
 import sys
 
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Only once per process since Streamlit re-executes this script on every rerun
+project_root = os.path.dirname(os.path.abspath(__file__))
+if project_root not in sys.path:
+    sys.path.append(project_root)
 
-from utils.visualization import create_world_map, create_industry_chart
+from utils.visualization import create_world_map
 from utils.data_manager import (
     initialize_session_data,
     get_session_events_data,
     fetch_tariff_events,
-    process_events_data,
-    get_events_statistics,
+    get_events_df_key,
+    update_session_data_with_custom_query,
 )
 
 # Set page configuration
@@ -99,6 +99,14 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
+
+# Map figure keyed on the DataFrame fingerprint; the underscore-prefixed
+# DataFrame argument is not hashed by Streamlit, so reruns skip hashing it
+@st.cache_data(show_spinner=False)
+def cached_world_map(events_df_key, _events_df, map_type, debug=False):
+    return create_world_map(_events_df, map_type, debug=debug)
+
+
 # Add logo to sidebar
 with st.sidebar:
     # Logo as text
@@ -182,19 +190,10 @@ if fetch_data:
         api_result = fetch_tariff_events(hours_to_look_back=hours_to_look_back)
 
         # Process the data and update session state
-        processed_events, events_df = process_events_data(api_result)
-        stats = get_events_statistics(processed_events)
-
-        # Update session state
-        st.session_state.api_result = api_result
-        st.session_state.processed_events = processed_events
-        st.session_state.events_df = events_df
-        st.session_state.stats = stats
-        st.session_state.events_initialized = True
-        st.session_state.last_update_time = datetime.now()
+        update_session_data_with_custom_query(api_result)
 
         st.success(
-            f"Successfully fetched {len(processed_events)} events from the past {hours_to_look_back} hours!"
+            f"Successfully fetched {len(st.session_state.processed_events)} events from the past {hours_to_look_back} hours!"
         )
 else:
     # Initialize data if needed
@@ -263,7 +262,11 @@ if processed_events:
     )
 
     # Create the map visualization (use debug mode from session state)
-    map_fig = create_world_map(
+    events_df_key = st.session_state.get("events_df_key") or get_events_df_key(
+        events_df
+    )
+    map_fig = cached_world_map(
+        events_df_key,
         events_df,
         "imposing" if map_type == "Imposing Countries" else "targeted",
         debug=st.session_state.debug_mode,
@@ -303,9 +306,11 @@ if processed_events:
             mime="text/csv",
         )
 
-        # Option to view raw JSON
+        # Option to view raw JSON. Expander content runs even while collapsed,
+        # so only serialize the full response once the user asks for it.
         with st.expander("View raw API response"):
-            st.code(json.dumps(api_result, indent=2), language="json")
+            if st.checkbox("Render raw JSON", key="render_raw_api_response"):
+                st.code(json.dumps(api_result, indent=2), language="json")
     else:
         st.warning("No events found in the data")
 else:
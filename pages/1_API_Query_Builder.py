@@ -1,19 +1,21 @@
 import streamlit as st
-import pandas as pd
 import json
 import os
 import sys
 from datetime import datetime, timedelta
 import pycountry
-from typing import Dict, List, Any, Optional, Union, Tuple
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path for imports, once per process since Streamlit
+# re-executes this script on every rerun
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
 from utils.api import format_api_request, call_events_api, check_api_health, get_api_key
-from utils.data_processing import events_to_dataframe, clean_event_data
 from utils.data_manager import (
-    get_session_events_data,
     initialize_session_data,
+    load_sample_data,
+    process_events_data,
+    get_events_statistics,
     update_session_data_with_custom_query,
 )
 
@@ -315,8 +317,7 @@ if query_button:
 
         if use_sample:
             # Load sample data
-            with open(os.path.join("data", "sample_tariff_events.json"), "r") as file:
-                api_result = json.load(file)
+            api_result = load_sample_data()
         else:
             # Call the actual API
             api_result = call_events_api(api_request, api_key)
@@ -328,10 +329,7 @@ if query_button:
                     st.code(api_result["details"])
                 # Fall back to sample data
                 st.warning("Falling back to sample data.")
-                with open(
-                    os.path.join("data", "sample_tariff_events.json"), "r"
-                ) as file:
-                    api_result = json.load(file)
+                api_result = load_sample_data()
 
     # Display results
     st.markdown(
@@ -351,37 +349,23 @@ if query_button:
                 "✅ Query results have been set as the active dataset for all pages."
             )
 
-        # Create DataFrame
-        processed_events = clean_event_data(events)
-        events_df = events_to_dataframe(processed_events)
+        # Create DataFrame (cached, shared with the session data update above)
+        processed_events, events_df = process_events_data(api_result)
 
         # Display summary
         st.markdown("#### Results Overview")
 
+        stats = get_events_statistics(processed_events)
+
         col1, col2, col3 = st.columns(3)
         with col1:
             st.metric("Total Events", len(events))
 
         with col2:
-            imposing_countries = set()
-            for event in events:
-                if (
-                    "tariffs_v2" in event
-                    and "imposing_country_name" in event["tariffs_v2"]
-                ):
-                    imposing_countries.add(event["tariffs_v2"]["imposing_country_name"])
-            st.metric("Imposing Countries", len(imposing_countries))
+            st.metric("Imposing Countries", len(stats["imposing_countries"]))
 
         with col3:
-            targeted_countries = set()
-            for event in events:
-                if (
-                    "tariffs_v2" in event
-                    and "targeted_country_names" in event["tariffs_v2"]
-                ):
-                    for country in event["tariffs_v2"]["targeted_country_names"]:
-                        targeted_countries.add(country)
-            st.metric("Targeted Countries", len(targeted_countries))
+            st.metric("Targeted Countries", len(stats["targeted_countries"]))
 
         # Display events table
         st.markdown("#### Events Table")
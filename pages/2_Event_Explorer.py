@@ -1,14 +1,20 @@
 import streamlit as st
-import pandas as pd
-import json
+import numpy as np
+import math
 import os
 import sys
-from urllib.parse import urlparse
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.data_processing import events_to_dataframe, clean_event_data
-from utils.data_manager import get_session_events_data, initialize_session_data
+# Add parent directory to path for imports, once per process since Streamlit
+# re-executes this script on every rerun
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+from utils.data_manager import (
+    get_session_events_data,
+    initialize_session_data,
+    get_events_df_key,
+)
+from utils.data_processing import extract_domain
 
 # Set page configuration
 st.set_page_config(
@@ -99,17 +105,64 @@ st.markdown(
 )
 
 
-# Helper function to extract domain from URL
-def extract_domain(url):
-    try:
-        parsed_url = urlparse(url)
-        domain = parsed_url.netloc
-        # Remove 'www.' if present
-        if domain.startswith("www."):
-            domain = domain[4:]
-        return domain
-    except:
-        return "Unknown source"
+# Number of event cards rendered per page
+EVENTS_PER_PAGE = 25
+
+
+# Helper function to format a list field as a comma-separated string
+def format_list(values):
+    return ", ".join(values) if isinstance(values, list) and values else "N/A"
+
+
+# Helper function to build the HTML card for a single event
+def build_event_card_html(event):
+    # Prepare article links HTML with consistent formatting, joining the
+    # parts once instead of growing a string per article
+    article_links_html = ""
+    if event.get("articles") and len(event["articles"]) > 0:
+        parts = ['<div class="article-links"><p class="sources-heading">Sources:</p>']
+        parts.extend(
+            f'<a href="{article["link"]}" target="_blank" class="article-link">{article["title"]} <span class="article-source">({extract_domain(article["link"])})</span></a>'
+            for article in event["articles"]
+            if article.get("link") and article.get("title")
+        )
+        parts.append("</div>")
+        article_links_html = "".join(parts)
+
+    # Create the event card with proper HTML rendering
+    return f"""
+    <div class="event-card">
+        <div class="event-title">{event['imposing_country']} → {format_list(event['targeted_countries'])}</div>
+        <div class="event-meta">
+            {event['announcement_date']} • {event['measure_type']} • 
+            <span class="tag tag-{event['relevance_score'].lower() if event['relevance_score'] else 'medium'}">{event['relevance_score']}</span>
+        </div>
+        <div class="event-summary">{event['summary']}</div>
+        <div class="event-details">
+            <strong>Affected Products:</strong> {format_list(event['affected_products'])}<br>
+            <strong>Tariff Rates:</strong> {format_list(event['tariff_rates'])}<br>
+            <strong>Implementation Date:</strong> {event['implementation_date'] if event['implementation_date'] else 'Not specified'}<br>
+            <strong>Industries:</strong> {format_list(event['affected_industries'])}<br>
+        </div>
+        {article_links_html}
+    </div>
+    """
+
+
+# Card HTML for every event, built once per dataset so a rerun only joins
+# the cards of the current page
+@st.cache_data(show_spinner=False)
+def get_event_cards_html(events_df_key, _events):
+    return [build_event_card_html(event) for event in _events]
+
+
+# Lowercased summaries for the keyword search, computed once per dataset
+@st.cache_data(show_spinner=False)
+def get_lowercase_summaries(events_df_key, _events_df):
+    return [
+        summary.lower() if isinstance(summary, str) else ""
+        for summary in _events_df["summary"].tolist()
+    ]
 
 
 # Initialize data if needed
@@ -119,6 +172,7 @@ if "events_initialized" not in st.session_state:
 
 # Get the current data from session state
 api_result, events, events_df, stats = get_session_events_data()
+events_df_key = st.session_state.get("events_df_key") or get_events_df_key(events_df)
 
 # Main content
 st.markdown('<div class="main-header">Event Explorer</div>', unsafe_allow_html=True)
@@ -130,11 +184,12 @@ st.markdown(
 # Sidebar filters
 st.sidebar.header("Filters")
 
-# Create filters based on available data
+# Create filters based on available data; the filter columns are categorical,
+# so their sorted categories serve directly as the options
 if not events_df.empty:
     # Filter by imposing country
     if "imposing_country" in events_df.columns:
-        imposing_countries = sorted(events_df["imposing_country"].unique())
+        imposing_countries = events_df["imposing_country"].cat.categories.tolist()
         selected_countries = st.sidebar.multiselect(
             "Imposing Countries", imposing_countries, default=[]
         )
@@ -143,7 +198,7 @@ if not events_df.empty:
 
     # Filter by measure type
     if "measure_type" in events_df.columns:
-        measure_types = sorted(events_df["measure_type"].unique())
+        measure_types = events_df["measure_type"].cat.categories.tolist()
         selected_measures = st.sidebar.multiselect(
             "Measure Types", measure_types, default=[]
         )
@@ -152,37 +207,39 @@ if not events_df.empty:
 
     # Filter by relevance score
     if "relevance_score" in events_df.columns:
-        relevance_scores = sorted(events_df["relevance_score"].unique())
+        relevance_scores = events_df["relevance_score"].cat.categories.tolist()
         selected_relevance = st.sidebar.multiselect(
             "Relevance Score", relevance_scores, default=[]
         )
     else:
         selected_relevance = []
 
-    # Apply filters
-    filtered_events = events.copy()
+    # Apply filters as one boolean mask over the DataFrame, whose rows line
+    # up with the processed events list
+    mask = np.ones(len(events_df), dtype=bool)
 
     if selected_countries:
-        filtered_events = [
-            e for e in filtered_events if e["imposing_country"] in selected_countries
-        ]
+        mask &= events_df["imposing_country"].isin(selected_countries).to_numpy()
 
     if selected_measures:
-        filtered_events = [
-            e for e in filtered_events if e["measure_type"] in selected_measures
-        ]
+        mask &= events_df["measure_type"].isin(selected_measures).to_numpy()
 
     if selected_relevance:
-        filtered_events = [
-            e for e in filtered_events if e["relevance_score"] in selected_relevance
-        ]
+        mask &= events_df["relevance_score"].isin(selected_relevance).to_numpy()
 
     # Search by keyword
     search_query = st.sidebar.text_input("Search by keyword in summary")
     if search_query:
-        filtered_events = [
-            e for e in filtered_events if search_query.lower() in e["summary"].lower()
-        ]
+        # Only scan the summaries of events that passed the cheaper filters,
+        # using the lowercased copies cached for this dataset
+        query = search_query.lower()
+        summaries = get_lowercase_summaries(events_df_key, events_df)
+        candidates = np.flatnonzero(mask)
+        mask[candidates] = [query in summaries[i] for i in candidates]
+
+    # Events are already ordered newest first, so filtering keeps that order
+    filtered_positions = np.flatnonzero(mask)
+    filtered_events = [events[i] for i in filtered_positions]
 
     st.sidebar.markdown("---")
     st.sidebar.markdown(
@@ -194,138 +251,90 @@ else:
 
 # Display events
 if filtered_events:
-    # Sort events by date (newest first)
-    filtered_events.sort(
-        key=lambda x: x["extraction_date"] if x["extraction_date"] else "", reverse=True
+    # Paginate so only one page of cards and detail expanders is rendered
+    n_pages = math.ceil(len(filtered_events) / EVENTS_PER_PAGE)
+
+    # Go back to the first page whenever the filtered result set changes
+    filter_signature = (
+        tuple(selected_countries),
+        tuple(selected_measures),
+        tuple(selected_relevance),
+        search_query,
+        len(filtered_events),
+    )
+    if st.session_state.get("explorer_filter_signature") != filter_signature:
+        st.session_state.explorer_filter_signature = filter_signature
+        st.session_state.explorer_page = 1
+
+    page = (
+        st.number_input("Page", min_value=1, max_value=n_pages, key="explorer_page")
+        if n_pages > 1
+        else 1
+    )
+    page_slice = slice((page - 1) * EVENTS_PER_PAGE, page * EVENTS_PER_PAGE)
+    page_events = filtered_events[page_slice]
+
+    # Render all cards on the page in a single markdown element, reusing the
+    # card HTML cached for this dataset
+    cards_html = get_event_cards_html(events_df_key, events)
+    st.markdown(
+        "\n".join(cards_html[i] for i in filtered_positions[page_slice]),
+        unsafe_allow_html=True,
     )
 
-    for event in filtered_events:
-        with st.container():
-            # Format affected products as comma-separated string
-            affected_products = (
-                ", ".join(event["affected_products"])
-                if isinstance(event["affected_products"], list)
-                and event["affected_products"]
-                else "N/A"
-            )
-
-            # Format tariff rates as comma-separated string
-            tariff_rates = (
-                ", ".join(event["tariff_rates"])
-                if isinstance(event["tariff_rates"], list) and event["tariff_rates"]
-                else "N/A"
-            )
-
-            # Format industries as comma-separated string
-            industries = (
-                ", ".join(event["affected_industries"])
-                if isinstance(event["affected_industries"], list)
-                and event["affected_industries"]
-                else "N/A"
-            )
-
-            # Format targeted countries
-            targeted_countries = (
-                ", ".join(event["targeted_countries"])
-                if isinstance(event["targeted_countries"], list)
-                and event["targeted_countries"]
-                else "N/A"
-            )
-
-            # Prepare article links HTML with consistent formatting
-            article_links_html = ""
-            if event.get("articles") and len(event["articles"]) > 0:
-                article_links_html = (
-                    '<div class="article-links"><p class="sources-heading">Sources:</p>'
-                )
-
-                for article in event["articles"]:
-                    if article.get("link") and article.get("title"):
-                        domain = extract_domain(article["link"])
-                        article_links_html += f'<a href="{article["link"]}" target="_blank" class="article-link">{article["title"]} <span class="article-source">({domain})</span></a>'
-
-                article_links_html += "</div>"
-
-            # Create the event card with proper HTML rendering
-            event_card_html = f"""
-            <div class="event-card">
-                <div class="event-title">{event['imposing_country']} → {targeted_countries}</div>
-                <div class="event-meta">
-                    {event['announcement_date']} • {event['measure_type']} • 
-                    <span class="tag tag-{event['relevance_score'].lower() if event['relevance_score'] else 'medium'}">{event['relevance_score']}</span>
-                </div>
-                <div class="event-summary">{event['summary']}</div>
-                <div class="event-details">
-                    <strong>Affected Products:</strong> {affected_products}<br>
-                    <strong>Tariff Rates:</strong> {tariff_rates}<br>
-                    <strong>Implementation Date:</strong> {event['implementation_date'] if event['implementation_date'] else 'Not specified'}<br>
-                    <strong>Industries:</strong> {industries}<br>
-                </div>
-                {article_links_html}
-            </div>
-            """
-
-            st.markdown(event_card_html, unsafe_allow_html=True)
+    for event in page_events:
+        targeted_countries = format_list(event["targeted_countries"])
 
         # Add expand/collapse for full details if needed
-        with st.expander("Show full details"):
+        with st.expander(
+            f"Show full details: {event['imposing_country']} → {targeted_countries}"
+        ):
             col1, col2 = st.columns(2)
 
+            # Each column is emitted as one markdown element; blank lines
+            # keep every field in its own paragraph
             with col1:
-                st.markdown("#### Key Information")
-                st.markdown(f"**Event ID:** {event.get('id', 'N/A')}")
-                st.markdown(
-                    f"**Extraction Date:** {event.get('extraction_date', 'N/A')}"
-                )
-                st.markdown(f"**Event Type:** {event.get('event_type', 'N/A')}")
+                targeted_codes = format_list(event["targeted_country_codes"])
                 st.markdown(
-                    f"**Global Event Type:** {event.get('global_event_type', 'N/A')}"
-                )
-
-                st.markdown("#### Countries")
-                st.markdown(
-                    f"**Imposing Country:** {event.get('imposing_country', 'N/A')} ({event.get('imposing_country_code', 'N/A')})"
-                )
-                st.markdown(f"**Targeted Countries:** {targeted_countries}")
-                targeted_codes = (
-                    ", ".join(event["targeted_country_codes"])
-                    if isinstance(event["targeted_country_codes"], list)
-                    and event["targeted_country_codes"]
-                    else "N/A"
+                    "\n\n".join(
+                        [
+                            "#### Key Information",
+                            f"**Event ID:** {event.get('id', 'N/A')}",
+                            f"**Extraction Date:** {event.get('extraction_date', 'N/A')}",
+                            f"**Event Type:** {event.get('event_type', 'N/A')}",
+                            f"**Global Event Type:** {event.get('global_event_type', 'N/A')}",
+                            "#### Countries",
+                            f"**Imposing Country:** {event.get('imposing_country', 'N/A')} ({event.get('imposing_country_code', 'N/A')})",
+                            f"**Targeted Countries:** {targeted_countries}",
+                            f"**Targeted Country Codes:** {targeted_codes}",
+                        ]
+                    )
                 )
-                st.markdown(f"**Targeted Country Codes:** {targeted_codes}")
 
             with col2:
-                st.markdown("#### Tariff Details")
-                st.markdown(f"**Measure Type:** {event.get('measure_type', 'N/A')}")
-                st.markdown(
-                    f"**Main Tariff Rate:** {event.get('main_tariff_rate', 'N/A')}"
-                )
-                st.markdown(
-                    f"**Announcement Date:** {event.get('announcement_date', 'N/A')}"
-                )
-                st.markdown(
-                    f"**Implementation Date:** {event.get('implementation_date', 'N/A')}"
-                )
-                st.markdown(
-                    f"**Expiration Date:** {event.get('expiration_date', 'Not specified') if event.get('expiration_date') else 'Not specified'}"
-                )
-                st.markdown(
-                    f"**Policy Objective:** {event.get('policy_objective', 'Not specified') if event.get('policy_objective') else 'Not specified'}"
-                )
-                st.markdown(
-                    f"**Legal Basis:** {event.get('legal_basis', 'Not specified') if event.get('legal_basis') else 'Not specified'}"
-                )
+                details = [
+                    "#### Tariff Details",
+                    f"**Measure Type:** {event.get('measure_type', 'N/A')}",
+                    f"**Main Tariff Rate:** {event.get('main_tariff_rate', 'N/A')}",
+                    f"**Announcement Date:** {event.get('announcement_date', 'N/A')}",
+                    f"**Implementation Date:** {event.get('implementation_date', 'N/A')}",
+                    f"**Expiration Date:** {event.get('expiration_date', 'Not specified') if event.get('expiration_date') else 'Not specified'}",
+                    f"**Policy Objective:** {event.get('policy_objective', 'Not specified') if event.get('policy_objective') else 'Not specified'}",
+                    f"**Legal Basis:** {event.get('legal_basis', 'Not specified') if event.get('legal_basis') else 'Not specified'}",
+                ]
 
                 # Display article sources in the expander as well
                 if event.get("articles") and len(event["articles"]) > 0:
-                    st.markdown("#### Sources")
-                    for article in event["articles"]:
-                        if article.get("link") and article.get("title"):
-                            domain = extract_domain(article["link"])
-                            st.markdown(
-                                f"- [{article['title']} ({domain})]({article['link']})"
-                            )
+                    details.append("#### Sources")
+                    details.append(
+                        "\n".join(
+                            f"- [{article['title']} ({extract_domain(article['link'])})]({article['link']})"
+                            for article in event["articles"]
+                            if article.get("link") and article.get("title")
+                        )
+                    )
+
+                st.markdown("\n\n".join(details))
 else:
     st.info("No events match the selected filters. Try adjusting your filter criteria.")
 
@@ -1,19 +1,24 @@
 import streamlit as st
-import pandas as pd
-import json
+import pyarrow as pa
 import os
-from datetime import datetime, timedelta
 import sys
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path for imports, once per process since Streamlit
+# re-executes this script on every rerun
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
 from utils.visualization import (
     create_event_timeline,
     create_world_map,
     create_industry_chart,
     create_measure_type_pie,
 )
-from utils.data_manager import get_session_events_data, initialize_session_data
+from utils.data_manager import (
+    get_session_events_data,
+    initialize_session_data,
+    get_events_df_key,
+)
 
 # Set page configuration
 st.set_page_config(
@@ -53,11 +58,46 @@ st.markdown(
         font-size: 1rem;
         color: #4d4d4d;
     }
+    .metric-row {
+        display: flex;
+        gap: 1rem;
+    }
+    .metric-row .metric-card {
+        flex: 1;
+    }
 </style>
 """,
     unsafe_allow_html=True,
 )
 
+
+# Figure builders keyed on the DataFrame fingerprint; the underscore-prefixed
+# DataFrame argument is not hashed by Streamlit, so reruns skip hashing it
+@st.cache_data(show_spinner=False)
+def cached_world_map(events_df_key, _events_df, map_type, debug=False):
+    return create_world_map(_events_df, map_type, debug=debug)
+
+
+@st.cache_data(show_spinner=False)
+def cached_industry_chart(events_df_key, _events_df):
+    return create_industry_chart(_events_df)
+
+
+@st.cache_data(show_spinner=False)
+def cached_measure_type_pie(events_df_key, _events_df):
+    return create_measure_type_pie(_events_df)
+
+
+@st.cache_data(show_spinner=False)
+def cached_event_timeline(events_df_key, _events_df):
+    return create_event_timeline(_events_df)
+
+
+@st.cache_data(show_spinner=False)
+def cached_latest_events_table(events_df_key, _events_df, columns):
+    return pa.Table.from_pandas(_events_df.head(5)[columns], preserve_index=False)
+
+
 # Initialize data if needed
 if "events_initialized" not in st.session_state:
     with st.spinner("Loading initial data..."):
@@ -86,6 +126,13 @@ with st.sidebar:
             f"Last updated: {st.session_state.last_update_time.strftime('%Y-%m-%d %H:%M')}"
         )
 
+# Fingerprint of the current DataFrame, used as the figure cache key
+events_df_key = st.session_state.get("events_df_key") or get_events_df_key(events_df)
+
+# Resolve emptiness and column membership once for the checks below
+events_df_empty = events_df.empty
+events_df_columns = set(events_df.columns)
+
 # Main content
 st.markdown(
     '<div class="main-header">Tariff Tracker Dashboard</div>', unsafe_allow_html=True
@@ -95,61 +142,21 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-# Sample metrics
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    st.markdown(
-        f"""
-    <div class="metric-card">
-        <div class="metric-value">{len(events)}</div>
-        <div class="metric-label">Total Events</div>
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
-
-with col2:
-    # Count unique imposing countries
-    imposing_countries = len(stats["imposing_countries"])
-
-    st.markdown(
-        f"""
-    <div class="metric-card">
-        <div class="metric-value">{imposing_countries}</div>
-        <div class="metric-label">Imposing Countries</div>
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
-
-with col3:
-    # Count unique targeted countries
-    targeted_countries = len(stats["targeted_countries"])
-
-    st.markdown(
-        f"""
-    <div class="metric-card">
-        <div class="metric-value">{targeted_countries}</div>
-        <div class="metric-label">Targeted Countries</div>
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
-
-with col4:
-    # Count unique products
-    products = len(stats["affected_products"])
-
-    st.markdown(
-        f"""
-    <div class="metric-card">
-        <div class="metric-value">{products}</div>
-        <div class="metric-label">Affected Products</div>
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
+# Sample metrics, rendered as a single row so the page sends one element
+metrics = [
+    (len(events), "Total Events"),
+    (len(stats["imposing_countries"]), "Imposing Countries"),
+    (len(stats["targeted_countries"]), "Targeted Countries"),
+    (len(stats["affected_products"]), "Affected Products"),
+]
+metric_cards_html = "".join(
+    f'<div class="metric-card"><div class="metric-value">{value}</div>'
+    f'<div class="metric-label">{label}</div></div>'
+    for value, label in metrics
+)
+st.markdown(
+    f'<div class="metric-row">{metric_cards_html}</div>', unsafe_allow_html=True
+)
 
 # Visualizations
 
@@ -160,7 +167,8 @@ map_type = st.radio(
 )
 
 # Create the map visualization - using session state for debug mode
-map_fig = create_world_map(
+map_fig = cached_world_map(
+    events_df_key,
     events_df,
     "imposing" if map_type == "Imposing Countries" else "targeted",
     debug=st.session_state.debug_mode,  # Use debug from session state
@@ -171,40 +179,47 @@ if map_fig:
 else:
     st.info("Not enough data to create the map visualization.")
 
-# Two-column layout for additional charts
-col1, col2 = st.columns(2)
+# The remaining charts sit below the fold, so they are only built on demand
+# (an expander would still build them while collapsed)
+show_more_charts = st.toggle(
+    "Show industry, measure type and timeline charts", value=False
+)
 
-with col1:
-    st.subheader("Industry Distribution")
-    industry_fig = create_industry_chart(events_df)
+if show_more_charts:
+    # Two-column layout for additional charts
+    col1, col2 = st.columns(2)
 
-    if industry_fig:
-        st.plotly_chart(industry_fig, use_container_width=True)
-    else:
-        st.info("Not enough industry data for visualization.")
+    with col1:
+        st.subheader("Industry Distribution")
+        industry_fig = cached_industry_chart(events_df_key, events_df)
 
-with col2:
-    st.subheader("Tariff Measure Types")
-    measure_fig = create_measure_type_pie(events_df)
+        if industry_fig:
+            st.plotly_chart(industry_fig, use_container_width=True)
+        else:
+            st.info("Not enough industry data for visualization.")
 
-    if measure_fig:
-        st.plotly_chart(measure_fig, use_container_width=True)
-    else:
-        st.info("Not enough measure type data for visualization.")
+    with col2:
+        st.subheader("Tariff Measure Types")
+        measure_fig = cached_measure_type_pie(events_df_key, events_df)
 
-# Recent events timeline
-st.subheader("Recent Tariff Events Timeline")
-timeline_fig = create_event_timeline(events_df)
+        if measure_fig:
+            st.plotly_chart(measure_fig, use_container_width=True)
+        else:
+            st.info("Not enough measure type data for visualization.")
 
-if timeline_fig:
-    st.plotly_chart(timeline_fig, use_container_width=True)
-else:
-    st.info("Not enough timeline data for visualization.")
+    # Recent events timeline
+    st.subheader("Recent Tariff Events Timeline")
+    timeline_fig = cached_event_timeline(events_df_key, events_df)
+
+    if timeline_fig:
+        st.plotly_chart(timeline_fig, use_container_width=True)
+    else:
+        st.info("Not enough timeline data for visualization.")
 
 # Sample events table
 st.subheader("Latest Events")
 
-if not events_df.empty:
+if not events_df_empty:
     # Show only essential columns for the table view
     display_cols = [
         "announcement_date",
@@ -216,10 +231,13 @@ if not events_df.empty:
     ]
 
     # Filter for display columns that actually exist in the dataframe
-    existing_cols = [col for col in display_cols if col in events_df.columns]
+    existing_cols = [col for col in display_cols if col in events_df_columns]
 
-    # Display table with the top 5 events
-    st.dataframe(events_df[existing_cols].head(5), use_container_width=True)
+    # Display table with the top 5 events, sliced once into an Arrow table
+    st.dataframe(
+        cached_latest_events_table(events_df_key, events_df, existing_cols),
+        use_container_width=True,
+    )
 else:
     st.warning("No events found in the data")
 
@@ -1,16 +1,21 @@
 import streamlit as st
 import pandas as pd
-import json
 import os
 import sys
 import plotly.express as px
-import plotly.graph_objects as go
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.data_processing import events_to_dataframe, clean_event_data
+# Add parent directory to path for imports, once per process since Streamlit
+# re-executes this script on every rerun
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+from utils.data_processing import split_comma_separated
 from utils.visualization import create_industry_chart, create_tariff_rates_histogram
-from utils.data_manager import get_session_events_data, initialize_session_data
+from utils.data_manager import (
+    get_events_df_key,
+    get_session_events_data,
+    initialize_session_data,
+)
 
 # Set page configuration
 st.set_page_config(
@@ -51,6 +56,19 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
+
+# Figure builders keyed on the DataFrame fingerprint; the underscore-prefixed
+# DataFrame arguments are not hashed by Streamlit, so reruns skip hashing them
+@st.cache_data(show_spinner=False)
+def cached_industry_chart(events_df_key, _events_df):
+    return create_industry_chart(_events_df)
+
+
+@st.cache_data(show_spinner=False)
+def cached_tariff_rates_histogram(events_df_key, industry, _industry_df):
+    return create_tariff_rates_histogram(_industry_df)
+
+
 # Initialize data if needed
 if "events_initialized" not in st.session_state:
     with st.spinner("Loading initial data..."):
@@ -58,6 +76,7 @@ if "events_initialized" not in st.session_state:
 
 # Get the current data from session state
 api_result, events, events_df, stats = get_session_events_data()
+events_df_key = st.session_state.get("events_df_key") or get_events_df_key(events_df)
 
 # Main content
 st.markdown('<div class="main-header">Industry Analysis</div>', unsafe_allow_html=True)
@@ -84,20 +103,17 @@ with st.container():
 # Extract and analyze industry data
 if not events_df.empty and "affected_industries" in events_df.columns:
     # Extract all industries from the comma-separated lists
-    all_industries = []
-    for ind_str in events_df["affected_industries"]:
-        if isinstance(ind_str, str) and ind_str:
-            all_industries.extend([ind.strip() for ind in ind_str.split(",")])
+    all_industries = split_comma_separated(events_df["affected_industries"])
 
     # Count occurrences of each industry
-    industry_counts = pd.Series(all_industries).value_counts().reset_index()
+    industry_counts = all_industries.value_counts().reset_index()
     industry_counts.columns = ["Industry", "Event Count"]
 
     # Display industry distribution
     st.subheader("Industry Distribution")
 
     # Create industry chart
-    industry_fig = create_industry_chart(events_df)
+    industry_fig = cached_industry_chart(events_df_key, events_df)
 
     if industry_fig:
         st.plotly_chart(industry_fig, use_container_width=True)
@@ -118,19 +134,21 @@ if not events_df.empty and "affected_industries" in events_df.columns:
     )
 
     if selected_industry:
-        # Filter events for the selected industry
-        industry_events = []
+        # Filter events for the selected industry, keeping their positions
+        industry_positions = []
 
-        for event in events:
+        for i, event in enumerate(events):
             industries = event.get("affected_industries", [])
             if isinstance(industries, list) and selected_industry in industries:
-                industry_events.append(event)
+                industry_positions.append(i)
             elif isinstance(industries, str) and selected_industry in industries:
-                industry_events.append(event)
+                industry_positions.append(i)
+
+        industry_events = [events[i] for i in industry_positions]
 
         if industry_events:
-            # Convert to DataFrame for analysis
-            industry_df = events_to_dataframe(industry_events)
+            # Reuse the already processed rows instead of rebuilding a DataFrame
+            industry_df = events_df.iloc[industry_positions].reset_index(drop=True)
 
             st.markdown(f"#### Analysis for {selected_industry} Industry")
 
@@ -212,7 +230,9 @@ if not events_df.empty and "affected_industries" in events_df.columns:
             st.markdown("#### Tariff Rate Analysis")
 
             # Create tariff rate histogram
-            rate_fig = create_tariff_rates_histogram(industry_df)
+            rate_fig = cached_tariff_rates_histogram(
+                events_df_key, selected_industry, industry_df
+            )
 
             if rate_fig:
                 st.plotly_chart(rate_fig, use_container_width=True)
@@ -0,0 +1,57 @@
+"""
+Generate utils/_iso_map.py from the ISO 3166 country codes CSV.
+
+The ISO-2 to ISO-3 mapping is static, so it is written out once as a Python
+literal instead of being parsed from the CSV at runtime. Re-run this script
+from the project root whenever data/country_codes_iso_3166.csv changes:
+
+    python scripts/gen_iso_map.py
+"""
+
+import csv
+import os
+from typing import Dict
+
+CSV_PATH = os.path.join("data", "country_codes_iso_3166.csv")
+OUTPUT_PATH = os.path.join("utils", "_iso_map.py")
+
+HEADER = """# Generated by scripts/gen_iso_map.py from data/country_codes_iso_3166.csv.
+# Do not edit by hand; re-run the script instead.
+
+"""
+
+
+def load_iso2_to_iso3(csv_path: str) -> Dict[str, str]:
+    """
+    Read the ISO-2 to ISO-3 country code mapping from the CSV file.
+
+    Args:
+        csv_path: Path to the ISO 3166 country codes CSV
+
+    Returns:
+        Dictionary mapping alpha-2 codes to alpha-3 codes
+    """
+    # The CSV separates fields with ", " so quoted values need
+    # skipinitialspace to be unquoted correctly
+    with open(csv_path, newline="") as file:
+        reader = csv.DictReader(file, skipinitialspace=True)
+        return {
+            row["Alpha-2 code"].strip(): row["Alpha-3 code"].strip() for row in reader
+        }
+
+
+def main() -> None:
+    mapping = load_iso2_to_iso3(CSV_PATH)
+
+    lines = [HEADER, "ISO2_TO_ISO3 = {\n"]
+    lines.extend(f'    "{iso2}": "{mapping[iso2]}",\n' for iso2 in sorted(mapping))
+    lines.append("}\n")
+
+    with open(OUTPUT_PATH, "w") as file:
+        file.writelines(lines)
+
+    print(f"Wrote {len(mapping)} country codes to {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
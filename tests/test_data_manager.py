@@ -0,0 +1,44 @@
+from utils.data_manager import get_events_df_key, process_events_data
+from utils.visualization import create_event_timeline
+
+
+def make_raw_event(event_id, **tariff_fields):
+    tariffs_v2 = {
+        "imposing_country_code": "US",
+        "imposing_country_name": "United States",
+        "targeted_country_codes": ["CN"],
+        "targeted_country_names": ["China"],
+        "measure_type": "new tariff",
+        "main_tariff_rate": 25.0,
+        "announcement_date": "2025-01-10",
+        "implementation_date": "2025-02-01",
+        "relevance_score": "High",
+        "summary": f"Event {event_id}",
+    }
+    tariffs_v2.update(tariff_fields)
+    return {
+        "id": event_id,
+        "extraction_date": "2025-01-11 08:00:00",
+        "tariffs_v2": tariffs_v2,
+        "articles": [],
+    }
+
+
+def test_timeline_accepts_event_without_summary():
+    api_result = {
+        "events": [make_raw_event("1"), make_raw_event("2", summary=None)]
+    }
+
+    _, events_df = process_events_data(api_result)
+    fig = create_event_timeline(events_df)
+
+    assert fig.to_json()
+
+
+def test_events_df_key_changes_when_content_changes():
+    _, events_df = process_events_data({"events": [make_raw_event("1")]})
+    _, edited_df = process_events_data(
+        {"events": [make_raw_event("1", summary="Edited summary")]}
+    )
+
+    assert get_events_df_key(events_df) != get_events_df_key(edited_df)
@@ -0,0 +1,187 @@
+import pandas as pd
+import pyarrow as pa
+
+from utils import data_processing
+from utils.data_processing import (
+    calculate_event_statistics,
+    clean_event_data,
+    events_to_dataframe,
+)
+
+
+def test_statistics_keep_list_items_containing_commas():
+    events = [
+        {
+            "targeted_countries": ["Korea, Republic of", "Japan"],
+            "affected_products": ["Nuts, bolts and screws", "Steel"],
+        },
+        {
+            "targeted_countries": "China, Mexico",
+            "affected_products": "Steel, Aluminum",
+        },
+    ]
+
+    stats = calculate_event_statistics(events)
+
+    assert stats["targeted_countries"] == [
+        "China",
+        "Japan",
+        "Korea, Republic of",
+        "Mexico",
+    ]
+    assert stats["affected_products"] == [
+        "Aluminum",
+        "Nuts, bolts and screws",
+        "Steel",
+    ]
+
+
+def per_event_statistics(events):
+    # The per-event loop calculate_event_statistics used to run
+    imposing_countries = set()
+    targeted_countries = set()
+    measure_types = {}
+    tariff_rates = []
+    industries = {}
+    products = set()
+
+    for event in events:
+        if event.get("imposing_country"):
+            imposing_countries.add(event["imposing_country"])
+
+        if isinstance(event.get("targeted_countries"), list):
+            targeted_countries.update(event["targeted_countries"])
+        elif isinstance(event.get("targeted_countries"), str):
+            targeted_countries.update(
+                [c.strip() for c in event["targeted_countries"].split(",")]
+            )
+
+        measure_type = event.get("measure_type", "unknown")
+        measure_types[measure_type] = measure_types.get(measure_type, 0) + 1
+
+        if event.get("main_tariff_rate") is not None:
+            try:
+                tariff_rates.append(float(event["main_tariff_rate"]))
+            except (ValueError, TypeError):
+                pass
+
+        if isinstance(event.get("affected_industries"), list):
+            for industry in event["affected_industries"]:
+                industries[industry] = industries.get(industry, 0) + 1
+        elif isinstance(event.get("affected_industries"), str):
+            for industry in [
+                i.strip() for i in event["affected_industries"].split(",")
+            ]:
+                if industry:
+                    industries[industry] = industries.get(industry, 0) + 1
+
+        if isinstance(event.get("affected_products"), list):
+            products.update(event["affected_products"])
+        elif isinstance(event.get("affected_products"), str):
+            products.update([p.strip() for p in event["affected_products"].split(",")])
+
+    avg_tariff_rate = sum(tariff_rates) / len(tariff_rates) if tariff_rates else 0
+
+    return {
+        "total_events": len(events),
+        "imposing_countries": sorted(imposing_countries),
+        "targeted_countries": sorted(targeted_countries),
+        "measure_types": measure_types,
+        "avg_tariff_rate": round(avg_tariff_rate, 2),
+        "affected_industries": industries,
+        "affected_products": sorted(products),
+    }
+
+
+def test_statistics_match_per_event_loop():
+    events = [
+        {
+            "imposing_country": "United States",
+            "targeted_countries": ["China", "Korea, Republic of"],
+            "measure_type": "new tariff",
+            "main_tariff_rate": 25,
+            "affected_industries": ["Food, beverages and tobacco", "Steel"],
+            "affected_products": ["Nuts, bolts and screws"],
+        },
+        {
+            "imposing_country": "China",
+            "targeted_countries": "United States, Canada",
+            "measure_type": "retaliatory tariff",
+            "main_tariff_rate": "10.5",
+            "affected_industries": "Agriculture, Food, beverages and tobacco",
+            "affected_products": "Soybeans, Pork",
+        },
+        {
+            "imposing_country": "Canada",
+            "targeted_countries": ["United States"],
+            "measure_type": "new tariff",
+            "main_tariff_rate": "unknown",
+            "affected_industries": ["Steel"],
+            "affected_products": [],
+        },
+        {
+            "imposing_country": None,
+            "targeted_countries": None,
+            "main_tariff_rate": None,
+            "affected_industries": None,
+            "affected_products": None,
+        },
+    ]
+
+    assert calculate_event_statistics(events) == per_event_statistics(events)
+
+
+def test_events_to_dataframe_arrow_path_matches_pandas_fallback(monkeypatch):
+    events = [
+        {
+            "id": "1",
+            "imposing_country": "United States",
+            "targeted_countries": ["China", "Korea, Republic of"],
+            "main_tariff_rate": 25.0,
+            "summary": "US tariff",
+            "articles": [
+                {"id": "a1", "title": "Tariffs", "link": "https://a.example"},
+            ],
+        },
+        {
+            "id": "2",
+            "imposing_country": "China",
+            "targeted_countries": [],
+            "main_tariff_rate": None,
+            "summary": None,
+            "articles": [
+                {
+                    "id": "a2",
+                    "link": "https://b.example",
+                    "title": "Retaliation",
+                    "media": "https://b.example/image.png",
+                },
+            ],
+        },
+    ]
+    arrow_df = events_to_dataframe(events)
+
+    def arrow_events_frame(records):
+        raise pa.ArrowInvalid("force the pandas fallback")
+
+    monkeypatch.setattr(data_processing, "_arrow_events_frame", arrow_events_frame)
+    pandas_df = events_to_dataframe(events)
+
+    pd.testing.assert_frame_equal(arrow_df, pandas_df)
+
+
+def test_clean_event_data_accepts_null_targeted_country_names():
+    events = [
+        {
+            "id": "1",
+            "tariffs_v2": {
+                "imposing_country_code": "US",
+                "targeted_country_codes": ["CN", "XX"],
+                "targeted_country_names": None,
+            },
+        }
+    ]
+
+    (event,) = clean_event_data(events)
+
+    assert event["targeted_countries"] == ["China", "XX"]
@@ -0,0 +1,49 @@
+import pandas as pd
+
+from utils.visualization import create_event_timeline, create_measure_type_pie
+
+
+def make_events_df():
+    # Filter columns are categorical, as produced by process_events_data
+    return pd.DataFrame(
+        {
+            "imposing_country": pd.Categorical(
+                ["United States", "China", "Canada"]
+            ),
+            "measure_type": pd.Categorical(
+                ["new tariff", "retaliatory tariff", "quota"]
+            ),
+            "announcement_date": ["2025-01-10", "2025-02-01", "2025-03-15"],
+            "implementation_date": ["2025-03-01", "", ""],
+            "summary": ["US tariff", "China retaliates", "Canada quota"],
+            "targeted_countries": ["China", "United States", "Mexico"],
+            "main_tariff_rate": [25.0, 10.0, None],
+        }
+    )
+
+
+def test_timeline_skips_measure_type_without_dated_events():
+    df = make_events_df()
+    df.loc[df["measure_type"] == "quota", "announcement_date"] = ""
+
+    fig = create_event_timeline(df)
+
+    assert {trace.name for trace in fig.data} == {
+        "new tariff",
+        "retaliatory tariff",
+    }
+
+
+def test_timeline_skips_measure_type_beyond_max_events():
+    fig = create_event_timeline(make_events_df(), max_events=2)
+
+    assert {trace.name for trace in fig.data} == {"retaliatory tariff", "quota"}
+
+
+def test_measure_type_pie_skips_filtered_out_measure_type():
+    df = make_events_df()
+    df = df[df["measure_type"] != "quota"]
+
+    fig = create_measure_type_pie(df)
+
+    assert set(fig.data[0].labels) == {"new tariff", "retaliatory tariff"}
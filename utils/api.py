@@ -1,8 +1,34 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Union, Optional, Any
 import streamlit as st
 from datetime import datetime, timedelta
 import json
+import orjson
+
+# (connect, read) timeout in seconds applied to every API call
+REQUEST_TIMEOUT = (3.05, 60)
+
+# Shared HTTP session so repeated API calls reuse pooled keep-alive
+# connections instead of opening a new TCP/TLS connection each time
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            # The events search POST is read-only, so it is safe to retry
+            allowed_methods=frozenset({"GET", "POST"}),
+            # Hand the last response back so its status code is reported
+            raise_on_status=False,
+        ),
+    ),
+)
 
 
 def get_api_key() -> Optional[str]:
@@ -69,45 +95,19 @@ def format_api_request(
     if event_date_range:
         params["additional_filters"]["event_date"] = event_date_range
 
-    # Add imposing country filters if provided
-    if imposing_countries and len(imposing_countries) > 0:
-        if len(imposing_countries) == 1:
-            params["additional_filters"]["tariffs_v2.imposing_country_code"] = (
-                imposing_countries[0]
-            )
-        else:
-            params["additional_filters"][
-                "tariffs_v2.imposing_country_code"
-            ] = imposing_countries
-
-    # Add targeted country filters if provided
-    if targeted_countries and len(targeted_countries) > 0:
-        if len(targeted_countries) == 1:
-            params["additional_filters"]["tariffs_v2.targeted_country_codes"] = (
-                targeted_countries[0]
-            )
-        else:
-            params["additional_filters"][
-                "tariffs_v2.targeted_country_codes"
-            ] = targeted_countries
-
-    # Add measure type filters if provided
-    if measure_types and len(measure_types) > 0:
-        if len(measure_types) == 1:
-            params["additional_filters"]["tariffs_v2.measure_type"] = measure_types[0]
-        else:
-            params["additional_filters"]["tariffs_v2.measure_type"] = measure_types
-
-    # Add industry filters if provided
-    if affected_industries and len(affected_industries) > 0:
-        if len(affected_industries) == 1:
-            params["additional_filters"]["tariffs_v2.affected_industries"] = (
-                affected_industries[0]
-            )
-        else:
-            params["additional_filters"][
-                "tariffs_v2.affected_industries"
-            ] = affected_industries
+    # Add the list filters that were provided; a single value is sent as a
+    # scalar rather than a one-element list
+    list_filters = (
+        ("tariffs_v2.imposing_country_code", imposing_countries),
+        ("tariffs_v2.targeted_country_codes", targeted_countries),
+        ("tariffs_v2.measure_type", measure_types),
+        ("tariffs_v2.affected_industries", affected_industries),
+    )
+    params["additional_filters"].update(
+        (key, values[0] if len(values) == 1 else values)
+        for key, values in list_filters
+        if values
+    )
 
     # Add minimum tariff rate filter if provided
     if min_tariff_rate is not None:
@@ -148,16 +148,19 @@ def call_events_api(
     # API endpoint
     url = "https://events.newscatcherapi.xyz/api/events_search"
 
-    # Set headers
+    # Set headers; the body is serialized with orjson, so the content type
+    # has to be set explicitly
     headers = {"x-api-token": api_key, "Content-Type": "application/json"}
 
     try:
         # Make API call
-        response = requests.post(url, headers=headers, json=params)
+        response = _session.post(
+            url, headers=headers, data=orjson.dumps(params), timeout=REQUEST_TIMEOUT
+        )
 
         # Check for successful response
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content)
         else:
             return {
                 "error": f"API request failed with status code {response.status_code}",
@@ -193,11 +196,11 @@ def check_api_health(api_key: Optional[str] = None) -> Dict[str, Any]:
 
     try:
         # Make API call
-        response = requests.get(url, headers=headers)
+        response = _session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
 
         # Check for successful response
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content)
         else:
             return {
                 "error": f"API health check failed with status code {response.status_code}",
@@ -233,11 +236,11 @@ def get_subscription_info(api_key: Optional[str] = None) -> Dict[str, Any]:
 
     try:
         # Make API call
-        response = requests.get(url, headers=headers)
+        response = _session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
 
         # Check for successful response
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content)
         else:
             return {
                 "error": f"Failed to get subscription info with status code {response.status_code}",
@@ -279,11 +282,13 @@ def get_event_fields(
 
     try:
         # Make API call
-        response = requests.get(url, headers=headers, params=params)
+        response = _session.get(
+            url, headers=headers, params=params, timeout=REQUEST_TIMEOUT
+        )
 
         # Check for successful response
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content)
         else:
             return {
                 "error": f"Failed to get event fields with status code {response.status_code}",
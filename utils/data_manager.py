@@ -1,6 +1,9 @@
 import streamlit as st
 import pandas as pd
+import hashlib
 import json
+import orjson
+import operator
 import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Union, Tuple
@@ -93,7 +96,9 @@ def fetch_tariff_events(
     return api_result
 
 
-@st.cache_data
+# Cache the parsed sample data as a shared resource: it is never mutated, so
+# every caller can share the same object instead of unpickling a copy
+@st.cache_resource
 def load_sample_data() -> Dict[str, Any]:
     """
     Load sample tariff events data from JSON file with caching.
@@ -103,24 +108,60 @@ def load_sample_data() -> Dict[str, Any]:
     """
     file_path = os.path.join("data", "sample_tariff_events.json")
     try:
-        with open(file_path, "r") as file:
-            data = json.load(file)
+        with open(file_path, "rb") as file:
+            data = orjson.loads(file.read())
             return data
     except FileNotFoundError:
         st.error(f"Sample data file not found at {file_path}")
         return {"events": []}
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, orjson.JSONDecodeError):
         st.error("Error parsing the sample data file")
         return {"events": []}
 
 
-@st.cache_data
 def process_events_data(
     api_result: Dict[str, Any],
 ) -> Tuple[List[Dict[str, Any]], pd.DataFrame]:
     """
     Process the event data from API result with caching.
 
+    The bundled sample data is cached on disk so it survives server
+    restarts; API and custom-query results are only cached in memory, with
+    a bounded number of entries, so the disk cache cannot grow without limit.
+
+    Args:
+        api_result: Dictionary containing API response data
+
+    Returns:
+        Tuple containing processed events list and events DataFrame
+    """
+    if api_result == load_sample_data():
+        return _process_sample_events_data(api_result)
+    return _process_api_events_data(api_result)
+
+
+# Hash the JSON payloads with orjson's C serializer rather than letting
+# Streamlit walk the nested dict
+@st.cache_data(persist="disk", hash_funcs={dict: orjson.dumps})
+def _process_sample_events_data(
+    sample_data: Dict[str, Any],
+) -> Tuple[List[Dict[str, Any]], pd.DataFrame]:
+    return _build_events_data(sample_data)
+
+
+@st.cache_data(ttl=3600, max_entries=16, hash_funcs={dict: orjson.dumps})
+def _process_api_events_data(
+    api_result: Dict[str, Any],
+) -> Tuple[List[Dict[str, Any]], pd.DataFrame]:
+    return _build_events_data(api_result)
+
+
+def _build_events_data(
+    api_result: Dict[str, Any],
+) -> Tuple[List[Dict[str, Any]], pd.DataFrame]:
+    """
+    Build the processed events list and events DataFrame from an API result.
+
     Args:
         api_result: Dictionary containing API response data
 
@@ -138,32 +179,34 @@ def process_events_data(
     # Clean and process events
     processed_events = clean_event_data(events)
 
-    # Convert to DataFrame
-    events_df = events_to_dataframe(processed_events)
-
-    # Important: Ensure country code columns exist and are in the correct format for mapping
-
-    # Check if imposing_country_code exists
-    if "imposing_country_code" not in events_df.columns and processed_events:
-        # Extract codes from processed events
-        events_df["imposing_country_code"] = [
-            e.get("imposing_country_code", "") for e in processed_events
-        ]
+    # Order events newest first once here, so pages can filter without
+    # re-sorting; clean_event_data always normalizes extraction_date to a str
+    processed_events.sort(key=operator.itemgetter("extraction_date"), reverse=True)
 
-    # Check if targeted_country_codes exists
-    if "targeted_country_codes" not in events_df.columns and processed_events:
-        # Extract codes from processed events
-        events_df["targeted_country_codes"] = [
-            e.get("targeted_country_codes", []) for e in processed_events
-        ]
+    # Convert to DataFrame; clean_event_data always emits the country code
+    # fields, so the code columns needed for mapping are already present
+    events_df = events_to_dataframe(processed_events)
 
     # Standardize countries - but keep country code formats intact
     events_df = standardize_countries_in_dataframe(events_df)
 
+    # Store the low-cardinality filter columns as categoricals
+    for col in ["imposing_country", "measure_type", "relevance_score"]:
+        if col in events_df.columns:
+            events_df[col] = events_df[col].astype("category")
+
+    # Keep the remaining text columns as Arrow-backed strings, which take less
+    # memory than Python str objects and use Arrow kernels for isin/str ops.
+    # Columns with nulls stay object: Arrow strings turn None into pd.NA,
+    # which plotly cannot serialize (e.g. a missing summary in hover text)
+    object_cols = events_df.select_dtypes(include="object")
+    string_cols = object_cols.columns[object_cols.notna().all().to_numpy()]
+    events_df[string_cols] = events_df[string_cols].astype("string[pyarrow]")
+
     return processed_events, events_df
 
 
-@st.cache_data
+@st.cache_data(hash_funcs={list: orjson.dumps})
 def get_events_statistics(processed_events: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Calculate statistics from processed events with caching.
@@ -177,6 +220,29 @@ def get_events_statistics(processed_events: List[Dict[str, Any]]) -> Dict[str, A
     return calculate_event_statistics(processed_events)
 
 
+def get_events_df_key(events_df: pd.DataFrame) -> str:
+    """
+    Compute a fingerprint identifying an events DataFrame.
+
+    The column names and every cell are hashed with pandas' vectorized row
+    hashing, so a re-query returning the same events with edited content gets
+    a new key. The key is computed once per dataset, so cached figures can be
+    keyed on this string instead of Streamlit hashing the DataFrame on each
+    rerun.
+
+    Args:
+        events_df: DataFrame containing event data
+
+    Returns:
+        Hex digest identifying the DataFrame contents
+    """
+    hasher = hashlib.md5(str(events_df.columns.tolist()).encode())
+    hasher.update(
+        pd.util.hash_pandas_object(events_df, index=False).values.tobytes()
+    )
+    return hasher.hexdigest()
+
+
 def initialize_session_data(force_refresh: bool = False) -> None:
     """
     Initialize or refresh session data from the API or sample data.
@@ -189,19 +255,8 @@ def initialize_session_data(force_refresh: bool = False) -> None:
         # Fetch recent events (last 24 hours by default)
         api_result = fetch_tariff_events(hours_to_look_back=24)
 
-        # Process the data
-        processed_events, events_df = process_events_data(api_result)
-
-        # Calculate statistics
-        stats = get_events_statistics(processed_events)
-
-        # Store in session state
-        st.session_state.api_result = api_result
-        st.session_state.processed_events = processed_events
-        st.session_state.events_df = events_df
-        st.session_state.stats = stats
-        st.session_state.events_initialized = True
-        st.session_state.last_update_time = datetime.now()
+        # Process the data and store it in session state
+        update_session_data_with_custom_query(api_result)
 
 
 def get_session_events_data() -> (
@@ -227,10 +282,13 @@ def get_session_events_data() -> (
 
 def update_session_data_with_custom_query(api_result: Dict[str, Any]) -> None:
     """
-    Update session data with custom query results.
+    Update session data with custom query or freshly fetched results.
+
+    This is the single place that processes an API result and stores it in
+    session state.
 
     Args:
-        api_result: Dictionary containing API response data from custom query
+        api_result: Dictionary containing API response data
     """
     # Process the new data
     processed_events, events_df = process_events_data(api_result)
@@ -242,6 +300,7 @@ def update_session_data_with_custom_query(api_result: Dict[str, Any]) -> None:
     st.session_state.api_result = api_result
     st.session_state.processed_events = processed_events
     st.session_state.events_df = events_df
+    st.session_state.events_df_key = get_events_df_key(events_df)
     st.session_state.stats = stats
     st.session_state.events_initialized = True
     st.session_state.last_update_time = datetime.now()
@@ -1,32 +1,85 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import os
 import streamlit as st
 from datetime import datetime
 import re
 import pycountry
-from typing import List, Dict, Any, Union, Optional, Set
-
-
-def clean_event_data(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Union, Optional, Set
+from urllib.parse import urlparse
+
+# Comma separator together with the whitespace around it
+_COMMA_SPLIT_RE = re.compile(r"\s*,\s*")
+
+# Date given as YYYY/MM or YYYY/MM/DD, capturing year, month and day
+_YMD_RE = re.compile(r"^(\d{4})/(\d{1,2})(?:/(\d{1,2}))?$")
+
+# Fields of a cleaned event, in the order clean_event_data emits them
+_EVENT_COLUMNS = (
+    "id",
+    "extraction_date",
+    "event_type",
+    "global_event_type",
+    "imposing_country",
+    "imposing_country_code",
+    "targeted_countries",
+    "targeted_country_codes",
+    "measure_type",
+    "affected_industries",
+    "affected_products",
+    "hs_product_categories",
+    "main_tariff_rate",
+    "tariff_rates",
+    "announcement_date",
+    "implementation_date",
+    "expiration_date",
+    "policy_objective",
+    "legal_basis",
+    "relevance_score",
+    "summary",
+    "articles",
+)
+
+# Article fields always present in a cleaned article, and optional ones
+# copied over only when the API returned them
+_ARTICLE_FIELDS = ("id", "title", "link", "media", "published_date", "name_source")
+_OPTIONAL_ARTICLE_FIELDS = ("description", "content", "authors", "language")
+
+# Fields clean_event_data emits as lists, flattened to strings in DataFrames
+_LIST_COLUMNS = (
+    "targeted_countries",
+    "targeted_country_codes",
+    "affected_industries",
+    "affected_products",
+    "hs_product_categories",
+    "tariff_rates",
+    "articles",
+)
+
+
+def iter_clean_events(events: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
     """
-    Clean and preprocess event data for analysis.
+    Clean and preprocess event data one event at a time.
+
+    Events without tariffs_v2 data are skipped.
 
     Args:
         events: List of event dictionaries from the API
 
-    Returns:
-        List of cleaned event data
+    Yields:
+        Cleaned event dictionaries with the fields in _EVENT_COLUMNS
     """
     if not events:
-        return []
+        return
 
-    cleaned_events = []
     code_to_name = load_country_codes()  # Load country code to name mapping
 
     for event in events:
         # Extract tariff_v2 data if it exists
-        tariff_data = event.get("tariffs_v2", {})
+        tariff_data = event.get("tariffs_v2")
         if not tariff_data:
             continue
 
@@ -44,46 +97,35 @@ def clean_event_data(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         targeted_countries = []
 
         if targeted_country_codes:
+            # Original name for each code, taken from the first position the
+            # code appears at, so unmapped codes need no list.index() scan;
+            # the names may be null even when codes are present
+            original_names = tariff_data.get("targeted_country_names") or []
+            original_name_by_code = {}
+            for code, name in zip(targeted_country_codes, original_names):
+                original_name_by_code.setdefault(code, name)
+
             for code in targeted_country_codes:
                 if code in code_to_name:
                     targeted_countries.append(code_to_name[code])
                 else:
-                    # If code not found in mapping, use original name if available
-                    original_names = tariff_data.get("targeted_country_names", [])
-                    idx = (
-                        targeted_country_codes.index(code)
-                        if code in targeted_country_codes
-                        else -1
-                    )
-                    if idx >= 0 and idx < len(original_names):
-                        targeted_countries.append(original_names[idx])
-                    else:
-                        targeted_countries.append(code)  # Use code as fallback
+                    # If code not found in mapping, use original name if available,
+                    # otherwise use the code as fallback
+                    targeted_countries.append(original_name_by_code.get(code, code))
         else:
             # If no codes available, use original country names
             targeted_countries = tariff_data.get("targeted_country_names", [])
 
         # Handle different formats of data, lists vs strings
-        affected_industries = tariff_data.get("affected_industries", [])
-        if isinstance(affected_industries, str):
-            affected_industries = [
-                ind.strip() for ind in affected_industries.split(",") if ind.strip()
-            ]
-
-        affected_products = tariff_data.get("affected_products", [])
-        if isinstance(affected_products, str):
-            affected_products = [
-                prod.strip() for prod in affected_products.split(",") if prod.strip()
-            ]
+        affected_industries = _split_if_string(
+            tariff_data.get("affected_industries", [])
+        )
+        affected_products = _split_if_string(tariff_data.get("affected_products", []))
 
         # No processing of HS categories - use as is
         hs_product_categories = tariff_data.get("hs_product_categories", [])
 
-        tariff_rates = tariff_data.get("tariff_rates", [])
-        if isinstance(tariff_rates, str):
-            tariff_rates = [
-                rate.strip() for rate in tariff_rates.split(",") if rate.strip()
-            ]
+        tariff_rates = _split_if_string(tariff_data.get("tariff_rates", []))
 
         # Create a cleaned event object with standardized fields
         cleaned_event = {
@@ -115,7 +157,23 @@ def clean_event_data(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             "articles": clean_article_data(event.get("articles", [])),
         }
 
-        cleaned_events.append(cleaned_event)
+        yield cleaned_event
+
+
+def clean_event_data(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Clean and preprocess event data for analysis.
+
+    Args:
+        events: List of event dictionaries from the API
+
+    Returns:
+        List of cleaned event data
+    """
+    if not events:
+        return []
+
+    cleaned_events = list(iter_clean_events(events))
 
     # Debug output if no events were processed
     if not cleaned_events:
@@ -131,10 +189,29 @@ def clean_event_data(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return cleaned_events
 
 
+def _split_if_string(value: Any) -> Any:
+    """
+    Split a comma-separated string field into a list of trimmed items.
+
+    Args:
+        value: Field value, either a list or a comma-separated string
+
+    Returns:
+        List of non-empty items if value is a string, otherwise value unchanged
+    """
+    if not isinstance(value, str):
+        return value
+    return [item for item in _COMMA_SPLIT_RE.split(value.strip()) if item]
+
+
+@lru_cache(maxsize=4096)
 def normalize_date(date_str: str) -> str:
     """
     Normalize date strings to a standard format.
 
+    Results are memoized, since the same extraction and announcement dates
+    recur across many events.
+
     Args:
         date_str: Date string in various formats
 
@@ -145,21 +222,18 @@ def normalize_date(date_str: str) -> str:
         return ""
 
     # Handle YYYY/MM/DD format
-    if re.match(r"^\d{4}/\d{1,2}(/\d{1,2})?$", date_str):
-        parts = date_str.split("/")
-        if len(parts) == 2:
+    match = _YMD_RE.match(date_str)
+    if match:
+        year, month, day = match.groups()
+        if day is None:
             # Only year and month are provided
-            return f"{parts[0]}-{parts[1].zfill(2)}"
-        elif len(parts) == 3:
-            # Year, month, and day are provided
-            return f"{parts[0]}-{parts[1].zfill(2)}-{parts[2].zfill(2)}"
+            return f"{year}-{month.zfill(2)}"
+        # Year, month, and day are provided
+        return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
 
     # Handle datetime string with format "YYYY-MM-DD HH:MM:SS"
     if " " in date_str:
-        try:
-            return date_str.split(" ")[0]
-        except:
-            pass
+        return date_str.partition(" ")[0]
 
     # Return original if we can't parse it
     return date_str
@@ -178,26 +252,48 @@ def clean_article_data(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     if not articles:
         return []
 
-    cleaned_articles = []
-
-    for article in articles:
-        cleaned_article = {
-            "id": article.get("id", ""),
-            "title": article.get("title", ""),
-            "link": article.get("link", ""),
-            "media": article.get("media", ""),
-            "published_date": article.get("published_date", ""),
-            "name_source": article.get("name_source", ""),
+    # Standard fields default to "", optional fields are kept only if present
+    return [
+        {
+            **{field: article.get(field, "") for field in _ARTICLE_FIELDS},
+            **{
+                field: article[field]
+                for field in _OPTIONAL_ARTICLE_FIELDS
+                if field in article
+            },
         }
+        for article in articles
+    ]
 
-        # Add optional fields if they exist
-        for field in ["description", "content", "authors", "language"]:
-            if field in article:
-                cleaned_article[field] = article[field]
 
-        cleaned_articles.append(cleaned_article)
+def _arrow_events_frame(events: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Build a DataFrame from event dictionaries through an Arrow table.
 
-    return cleaned_articles
+    Only the scalar columns are converted by Arrow. List and dict columns
+    are taken from the source dictionaries, because Arrow would turn dicts
+    into structs that come back with every field of the struct, so missing
+    optional fields would reappear as None.
+
+    Args:
+        events: List of event dictionaries
+
+    Returns:
+        DataFrame matching the one pd.DataFrame builds from the same events
+
+    Raises:
+        pa.ArrowInvalid, pa.ArrowTypeError: If Arrow cannot type a column
+    """
+    table = pa.Table.from_pylist(events)
+    nested = [
+        field.name for field in table.schema if pa.types.is_nested(field.type)
+    ]
+
+    df = table.drop_columns(nested).to_pandas()
+    for name in nested:
+        df[name] = [event.get(name) for event in events]
+
+    return df[table.column_names]
 
 
 def events_to_dataframe(events: List[Dict[str, Any]]) -> pd.DataFrame:
@@ -215,53 +311,46 @@ def events_to_dataframe(events: List[Dict[str, Any]]) -> pd.DataFrame:
         return pd.DataFrame()
 
     # Clean the event data first if not already cleaned
-    if "tariffs_v2" in events[0]:
+    raw_events = "tariffs_v2" in events[0]
+    if raw_events:
         print("Converting raw API events to cleaned format")
-        cleaned_events = clean_event_data(events)
     else:
         print("Events already in cleaned format")
-        cleaned_events = events
 
     # Create DataFrame
     try:
-        df = pd.DataFrame(cleaned_events)
+        if raw_events:
+            # Consume the cleaned events as they are produced, so no second
+            # list of dicts is held alongside the input
+            df = pd.DataFrame.from_records(
+                iter_clean_events(events), columns=_EVENT_COLUMNS
+            )
+        else:
+            # Build the columns through Arrow, which infers types in C instead
+            # of per row in Python. Records Arrow cannot type (e.g. a field
+            # mixing numbers and strings) fall back to the plain pandas
+            # constructor.
+            try:
+                df = _arrow_events_frame(events)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                df = pd.DataFrame(events)
 
         # Debug information
         print(f"Created DataFrame with {len(df)} rows and {len(df.columns)} columns")
         print(f"Columns: {df.columns.tolist()}")
 
-        # Handle list columns by converting to string representation
-        for col in df.columns:
-            if df[col].apply(lambda x: isinstance(x, list)).any():
-                print(f"Converting list column to string: {col}")
-
-                # Special handling for hs_product_categories to keep them intact
-                if col == "hs_product_categories":
-                    df[col] = df[col].apply(
-                        lambda x: (
-                            ", ".join([str(item) for item in x])
-                            if isinstance(x, list)
-                            else x
-                        )
-                    )
-                else:
-                    # Regular handling for other list columns
-                    df[col] = df[col].apply(
-                        lambda x: (
-                            ", ".join(
-                                [
-                                    (
-                                        str(item)
-                                        if not isinstance(item, dict)
-                                        else str(item.get("name", str(item)))
-                                    )
-                                    for item in x
-                                ]
-                            )
-                            if isinstance(x, list)
-                            else x
-                        )
-                    )
+        # Handle list columns by converting to string representation; only the
+        # fields known to hold lists are converted
+        for col in _LIST_COLUMNS:
+            if col not in df.columns:
+                continue
+            print(f"Converting list column to string: {col}")
+
+            # Special handling for hs_product_categories to keep them intact;
+            # other list columns use the names of dict items. A comprehension
+            # over the underlying object array skips the Series.map machinery.
+            join = _join_list if col == "hs_product_categories" else _join_list_names
+            df[col] = [join(value) for value in df[col].to_numpy()]
 
         return df
     except Exception as e:
@@ -270,12 +359,94 @@ def events_to_dataframe(events: List[Dict[str, Any]]) -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def _join_list(value: Any) -> Any:
+    """
+    Join a list cell into a comma-separated string.
+
+    Args:
+        value: Cell value (Arrow hands list cells back as numpy arrays)
+
+    Returns:
+        Comma-separated string if value is a list, otherwise value unchanged
+    """
+    if isinstance(value, (list, np.ndarray)):
+        return ", ".join([str(item) for item in value])
+    return value
+
+
+def _join_list_names(value: Any) -> Any:
+    """
+    Join a list cell into a comma-separated string, using the "name" of
+    dict items where present.
+
+    Args:
+        value: Cell value (Arrow hands list cells back as numpy arrays)
+
+    Returns:
+        Comma-separated string if value is a list, otherwise value unchanged
+    """
+    if isinstance(value, (list, np.ndarray)):
+        return ", ".join([_format_list_item(item) for item in value])
+    return value
+
+
+def _format_list_item(item: Any) -> str:
+    """
+    Format one list item, using its "name" if it is a dict.
+
+    Args:
+        item: List item
+
+    Returns:
+        The item's name if it is a dict with one, otherwise str(item)
+    """
+    if isinstance(item, dict) and "name" in item:
+        return str(item["name"])
+    return str(item)
+
+
+def split_comma_separated(values: pd.Series) -> pd.Series:
+    """
+    Split a column of comma-separated strings into a flat Series of items.
+
+    Splitting and whitespace trimming run as Arrow compute kernels, so no
+    per-row Python lists are built.
+
+    Args:
+        values: Series of comma-separated strings; empty or non-string
+            values are skipped
+
+    Returns:
+        Series with one trimmed item per entry
+    """
+    try:
+        strings = pa.array(values, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        strings = pa.array([v for v in values if isinstance(v, str)], type=pa.string())
+
+    strings = pc.drop_null(strings)
+    strings = pc.filter(strings, pc.not_equal(strings, ""))
+    items = pc.utf8_trim_whitespace(
+        pc.list_flatten(pc.split_pattern(strings, pattern=","))
+    )
+
+    return pd.Series(items.to_pandas(), dtype=object)
+
+
+# Rows of the TF-IDF matrix multiplied at once when detecting duplicates,
+# which bounds the similarity block held in memory to this many rows
+_SIMILARITY_BLOCK_ROWS = 256
+
+
 def detect_potential_duplicates(
     events: List[Dict[str, Any]], threshold: float = 0.7
 ) -> List[List[Dict[str, Any]]]:
     """
     Detect potential duplicate events based on similarity of key fields.
 
+    Events are grouped by connected components of the similarity graph, so
+    events similar through a chain of matches share one group.
+
     Args:
         events: List of event dictionaries
         threshold: Similarity threshold for considering events as duplicates
@@ -283,49 +454,92 @@ def detect_potential_duplicates(
     Returns:
         List of groups of potentially duplicate events
     """
+    from scipy.sparse import vstack
+    from scipy.sparse.csgraph import connected_components
     from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
 
     if not events or len(events) < 2:
         return []
 
-    # Create a list of event summaries
-    summaries = [event.get("summary", "") for event in events]
-
-    # Calculate TF-IDF vectors for each summary
-    vectorizer = TfidfVectorizer(stop_words="english")
-    tfidf_matrix = vectorizer.fit_transform(summaries)
-
-    # Calculate cosine similarity between all pairs of summaries
-    similarity_matrix = cosine_similarity(tfidf_matrix)
+    # Only events with a non-blank summary can match another event, so the
+    # rest are left out of the vectorization and similarity steps
+    events = [
+        event
+        for event in events
+        if isinstance(event.get("summary"), str) and event["summary"].strip()
+    ]
 
-    # Find groups of similar events
-    duplicate_groups = []
-    processed_indices = set()
-
-    for i in range(len(events)):
-        if i in processed_indices:
-            continue
-
-        # Find events similar to the current one
-        similar_indices = [
-            j
-            for j in range(len(events))
-            if j != i and similarity_matrix[i, j] >= threshold
-        ]
+    if len(events) < 2:
+        return []
 
-        if similar_indices:
-            # Create a group with the current event and all similar events
-            group = [events[i]] + [events[j] for j in similar_indices]
-            duplicate_groups.append(group)
+    # Create a list of event summaries
+    summaries = [event["summary"] for event in events]
+
+    # Calculate TF-IDF vectors for each summary from character n-grams within
+    # word boundaries, which tolerate typos and rewording better than whole
+    # words; n-grams seen in a single summary cannot link two events, so they
+    # are dropped, and the vocabulary size is capped
+    vectorizer = TfidfVectorizer(
+        analyzer="char_wb",
+        ngram_range=(3, 5),
+        sublinear_tf=True,
+        min_df=2,
+        max_features=100_000,
+    )
+    try:
+        tfidf_matrix = vectorizer.fit_transform(summaries)
+    except ValueError:
+        # No n-gram is shared by two summaries
+        return []
 
-            # Mark all events in this group as processed
-            processed_indices.add(i)
-            processed_indices.update(similar_indices)
+    # TF-IDF rows are L2-normalized, so the sparse product with the transpose
+    # is the cosine similarity. Character n-grams make nearly every pair
+    # share some n-gram, so the full product would be dense; it is computed
+    # one block of rows at a time, keeping only the pairs at or above the
+    # threshold before the next block is multiplied
+    blocks = []
+    for start in range(0, tfidf_matrix.shape[0], _SIMILARITY_BLOCK_ROWS):
+        block = tfidf_matrix[start : start + _SIMILARITY_BLOCK_ROWS]
+        blocks.append((block @ tfidf_matrix.T).tocsr() >= threshold)
+    similar_pairs = vstack(blocks, format="csr")
+
+    # Events linked directly or through a chain of similar events form one
+    # group, so every event lands in exactly one group
+    _, labels = connected_components(similar_pairs, directed=False)
+
+    # Collect the members of each group in event order; groups are ordered by
+    # their first event
+    groups = {}
+    for i, label in enumerate(labels.tolist()):
+        groups.setdefault(label, []).append(events[i])
+
+    duplicate_groups = [group for group in groups.values() if len(group) > 1]
 
     return duplicate_groups
 
 
+# Names pycountry does not resolve to the code used in the event data
+_SPECIAL_COUNTRY_CODES = {
+    "United States": "US",
+    "United States of America": "US",
+    "USA": "US",
+    "UK": "GB",
+    "United Kingdom": "GB",
+    "European Union": "EU",
+    "EU": "EU",
+}
+
+# Forward and reverse pycountry lookups built once; keys are case-folded the
+# way pycountry.countries.get() matches them
+_COUNTRY_NAME_TO_CODE = {
+    country.name.lower(): country.alpha_2 for country in pycountry.countries
+}
+_COUNTRY_CODE_TO_NAME = {
+    country.alpha_2.lower(): country.name for country in pycountry.countries
+}
+
+
+@lru_cache(maxsize=4096)
 def get_country_code(country_name: str) -> Optional[str]:
     """
     Get the ISO 3166-1 alpha-2 country code for a country name.
@@ -336,11 +550,12 @@ def get_country_code(country_name: str) -> Optional[str]:
     Returns:
         Country code or None if not found
     """
-    try:
-        country = pycountry.countries.get(name=country_name)
-        if country:
-            return country.alpha_2
+    if isinstance(country_name, str):
+        country_code = _COUNTRY_NAME_TO_CODE.get(country_name.lower())
+        if country_code:
+            return country_code
 
+    try:
         # Try searching by partial name
         countries = pycountry.countries.search_fuzzy(country_name)
         if countries:
@@ -349,19 +564,10 @@ def get_country_code(country_name: str) -> Optional[str]:
         pass
 
     # Handle special cases
-    special_cases = {
-        "United States": "US",
-        "United States of America": "US",
-        "USA": "US",
-        "UK": "GB",
-        "United Kingdom": "GB",
-        "European Union": "EU",
-        "EU": "EU",
-    }
-
-    return special_cases.get(country_name)
+    return _SPECIAL_COUNTRY_CODES.get(country_name)
 
 
+@lru_cache(maxsize=4096)
 def get_country_name(country_code: str) -> str:
     """
     Get the country name for an ISO 3166-1 alpha-2 country code.
@@ -375,20 +581,20 @@ def get_country_name(country_code: str) -> str:
     if country_code == "EU":
         return "European Union"
 
-    try:
-        country = pycountry.countries.get(alpha_2=country_code)
-        if country:
-            return country.name
-    except:
-        pass
+    if isinstance(country_code, str):
+        return _COUNTRY_CODE_TO_NAME.get(country_code.lower(), country_code)
 
     return country_code
 
 
+@lru_cache(maxsize=1)
 def load_country_codes() -> Dict[str, str]:
     """
     Load ISO 3166 country codes and names from CSV file.
 
+    The file is read once per process and the same dictionary is returned to
+    every caller, so it must be treated as read-only.
+
     Returns:
         Dictionary mapping country codes to standardized country names
     """
@@ -425,11 +631,24 @@ def load_country_codes() -> Dict[str, str]:
     try:
         country_codes_path = os.path.join("data", "country_codes_iso_3166.csv")
         if os.path.exists(country_codes_path):
-            country_df = pd.read_csv(country_codes_path)
-            code_to_name = {
-                row["Alpha-2 code"].strip(): row["Country"].strip()
-                for _, row in country_df.iterrows()
-            }
+            # Only the two mapped columns are needed; Arrow-backed strings
+            # strip in one vectorized pass instead of per-row Python objects.
+            # The CSV separates fields with ", " so quoted values need
+            # skipinitialspace to be unquoted correctly, and keep_default_na
+            # stops Namibia's code "NA" from being read as missing
+            country_df = pd.read_csv(
+                country_codes_path,
+                usecols=["Country", "Alpha-2 code"],
+                skipinitialspace=True,
+                keep_default_na=False,
+                dtype_backend="pyarrow",
+            )
+            code_to_name = dict(
+                zip(
+                    country_df["Alpha-2 code"].str.strip().tolist(),
+                    country_df["Country"].str.strip().tolist(),
+                )
+            )
 
             # Add EU manually as it's not in ISO 3166 but used in our app
             code_to_name["EU"] = "European Union"
@@ -453,7 +672,8 @@ def standardize_countries_in_dataframe(df: pd.DataFrame) -> pd.DataFrame:
         df: DataFrame with country names to standardize
 
     Returns:
-        DataFrame with standardized country names
+        DataFrame with standardized country names; columns other than
+        imposing_country share their data with df
     """
     if df.empty:
         return df
@@ -461,9 +681,6 @@ def standardize_countries_in_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     # Load country code to name mapping
     code_to_name = load_country_codes()
 
-    # Create a copy of the DataFrame
-    standardized_df = df.copy()
-
     # Country name cleanup and standardization
     country_name_mapping = {
         "United States of America": "United States",
@@ -476,20 +693,23 @@ def standardize_countries_in_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     }
 
     # Update with any additional mappings from ISO codes
-    if "imposing_country_code" in standardized_df.columns:
-        for _, row in standardized_df.iterrows():
-            if (
-                pd.notna(row["imposing_country_code"])
-                and row["imposing_country_code"] in code_to_name
-            ):
-                code = row["imposing_country_code"]
-                country_name_mapping[code] = code_to_name[code]
-
-                # Also map any existing country name to the standardized name
-                if pd.notna(row["imposing_country"]):
-                    country_name_mapping[row["imposing_country"]] = code_to_name[code]
-
-    # Apply the mapping to imposing_country column
+    if "imposing_country_code" in df.columns:
+        known = df[df["imposing_country_code"].isin(list(code_to_name))]
+        standard_names = known["imposing_country_code"].map(code_to_name)
+        country_name_mapping.update(
+            zip(known["imposing_country_code"], standard_names)
+        )
+
+        # Also map any existing country name to the standardized name
+        if "imposing_country" in known.columns:
+            named = known["imposing_country"].notna()
+            country_name_mapping.update(
+                zip(known.loc[named, "imposing_country"], standard_names[named])
+            )
+
+    # Apply the mapping to imposing_country column on a shallow copy, which
+    # shares the other columns instead of copying the whole DataFrame
+    standardized_df = df.copy(deep=False)
     if "imposing_country" in standardized_df.columns:
         standardized_df["imposing_country"] = standardized_df[
             "imposing_country"
@@ -498,6 +718,35 @@ def standardize_countries_in_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     return standardized_df
 
 
+def _list_items(values: pd.Series) -> pd.Series:
+    """
+    Flatten a column holding lists or comma-separated strings into its items.
+
+    Only string cells are split on commas; list elements are kept whole,
+    since an item such as "Nuts, bolts and screws" may contain a comma.
+
+    Args:
+        values: Series whose cells are lists, comma-separated strings or null
+
+    Returns:
+        Series with one item per entry
+    """
+    return values.map(_split_if_string).explode().dropna().astype(str)
+
+
+def _unique_list_items(values: pd.Series) -> List[str]:
+    """
+    Collect the unique items of a column holding lists or comma-separated strings.
+
+    Args:
+        values: Series whose cells are lists, comma-separated strings or null
+
+    Returns:
+        Sorted list of unique items
+    """
+    return sorted(_list_items(values).unique().tolist())
+
+
 def calculate_event_statistics(events: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Calculate various statistics from a list of tariff events.
@@ -519,67 +768,72 @@ def calculate_event_statistics(events: List[Dict[str, Any]]) -> Dict[str, Any]:
             "affected_products": [],
         }
 
-    # Initialize variables
-    imposing_countries: Set[str] = set()
-    targeted_countries: Set[str] = set()
-    measure_types: Dict[str, int] = {}
-    tariff_rates: List[float] = []
-    industries: Dict[str, int] = {}
-    products: Set[str] = set()
-
-    # Process each event
-    for event in events:
-        # Imposing country
-        if event.get("imposing_country"):
-            imposing_countries.add(event["imposing_country"])
-
-        # Targeted countries
-        if isinstance(event.get("targeted_countries"), list):
-            targeted_countries.update(event["targeted_countries"])
-        elif isinstance(event.get("targeted_countries"), str):
-            targeted_countries.update(
-                [c.strip() for c in event["targeted_countries"].split(",")]
-            )
-
-        # Measure type
-        measure_type = event.get("measure_type", "unknown")
-        measure_types[measure_type] = measure_types.get(measure_type, 0) + 1
-
-        # Tariff rate
-        if event.get("main_tariff_rate") is not None:
-            try:
-                rate = float(event["main_tariff_rate"])
-                tariff_rates.append(rate)
-            except (ValueError, TypeError):
-                pass
-
-        # Industries
-        if isinstance(event.get("affected_industries"), list):
-            for industry in event["affected_industries"]:
-                industries[industry] = industries.get(industry, 0) + 1
-        elif isinstance(event.get("affected_industries"), str):
-            for industry in [
-                i.strip() for i in event["affected_industries"].split(",")
-            ]:
-                if industry:
-                    industries[industry] = industries.get(industry, 0) + 1
-
-        # Products
-        if isinstance(event.get("affected_products"), list):
-            products.update(event["affected_products"])
-        elif isinstance(event.get("affected_products"), str):
-            products.update([p.strip() for p in event["affected_products"].split(",")])
-
-    # Calculate average tariff rate
-    avg_tariff_rate = sum(tariff_rates) / len(tariff_rates) if tariff_rates else 0
+    # Build the fields once as columns and aggregate them with vectorized
+    # pandas operations instead of per-event dict and set updates
+    df = pd.DataFrame.from_records(
+        events,
+        columns=[
+            "imposing_country",
+            "measure_type",
+            "main_tariff_rate",
+            "affected_industries",
+            "targeted_countries",
+            "affected_products",
+        ],
+    )
+
+    # Imposing countries, skipping empty names
+    imposing = df["imposing_country"]
+    imposing_countries = sorted(imposing[imposing.notna() & (imposing != "")].unique())
+
+    # Measure type counts, in order of first appearance
+    measure_types = df["measure_type"].fillna("unknown")
+    measure_types = measure_types.groupby(measure_types, sort=False).size().to_dict()
+
+    # Average of the tariff rates that parse as numbers
+    tariff_rates = pd.to_numeric(df["main_tariff_rate"], errors="coerce").dropna()
+    avg_tariff_rate = float(tariff_rates.mean()) if not tariff_rates.empty else 0
+
+    # Industry counts over list items or comma-separated entries
+    industries = _list_items(df["affected_industries"])
+    industries = industries[industries != ""]
+    industries = industries.groupby(industries, sort=False).size().to_dict()
+
+    # Unique targeted countries and products
+    targeted_countries = _unique_list_items(df["targeted_countries"])
+    products = _unique_list_items(df["affected_products"])
 
     # Return statistics
     return {
         "total_events": len(events),
-        "imposing_countries": sorted(list(imposing_countries)),
-        "targeted_countries": sorted(list(targeted_countries)),
+        "imposing_countries": imposing_countries,
+        "targeted_countries": targeted_countries,
         "measure_types": measure_types,
         "avg_tariff_rate": round(avg_tariff_rate, 2),
         "affected_industries": industries,
-        "affected_products": sorted(list(products)),
+        "affected_products": products,
     }
+
+
+@lru_cache(maxsize=4096)
+def extract_domain(url: str) -> str:
+    """
+    Extract the display domain from an article URL.
+
+    Results are memoized, since the same article links are rendered on every
+    rerun of the Event Explorer.
+
+    Args:
+        url: Article URL
+
+    Returns:
+        Domain without a leading 'www.', or 'Unknown source' if unparseable
+    """
+    try:
+        domain = urlparse(url).netloc
+        # Remove 'www.' if present
+        if domain.startswith("www."):
+            domain = domain[4:]
+        return domain
+    except ValueError:
+        return "Unknown source"
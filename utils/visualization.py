@@ -8,16 +8,76 @@ import seaborn as sns
 from datetime import datetime, timedelta
 import altair as alt
 import os
+from collections import Counter
 from typing import Optional, Dict, List, Any, Union
 
+from utils._iso_map import ISO2_TO_ISO3
+from utils.data_processing import split_comma_separated
+
+# ISO-2 to ISO-3 codes for the world map: the generated ISO 3166 mapping plus
+# the non-ISO codes used by the API
+MAP_ISO2_TO_ISO3 = {**ISO2_TO_ISO3, "EU": "EUR", "All": "WLD"}
+
+
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """
+    Parse a column of date strings into timestamps.
+
+    ISO 8601 strings (including month-only dates such as "2025-01") are
+    parsed in one format-pinned pass; only the leftovers go through the
+    slower per-element format inference.
+
+    Args:
+        values: Series of date strings
+
+    Returns:
+        Series of timestamps, NaT where a value could not be parsed
+    """
+    dates = pd.to_datetime(values, format="ISO8601", errors="coerce")
+
+    leftover = dates.isna() & values.notna() & (values != "")
+    if leftover.any():
+        dates[leftover] = pd.to_datetime(
+            values[leftover], format="mixed", errors="coerce"
+        )
+
+    return dates
+
+
+def _drop_unused_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Remove categories that have no rows left from the categorical columns.
+
+    Plotly builds one trace per category of a categorical column, so
+    categories emptied by filtering would otherwise be plotted as empty
+    traces or, in px.timeline, raise a KeyError.
+
+    Args:
+        df: DataFrame to clean up
+
+    Returns:
+        DataFrame whose categorical columns only hold categories in use
+    """
+    cat_cols = df.select_dtypes(include="category").columns
+    if cat_cols.empty:
+        return df
+
+    return df.assign(
+        **{col: df[col].cat.remove_unused_categories() for col in cat_cols}
+    )
+
 
 @st.cache_data
-def create_event_timeline(events_df: pd.DataFrame) -> Optional[go.Figure]:
+def create_event_timeline(
+    events_df: pd.DataFrame, max_events: int = 500
+) -> Optional[go.Figure]:
     """
     Create a timeline visualization of tariff events.
 
     Args:
         events_df: DataFrame containing event data
+        max_events: Maximum number of bars to draw; only the most recently
+            announced events are kept beyond this
 
     Returns:
         Timeline figure or None if insufficient data
@@ -42,31 +102,34 @@ def create_event_timeline(events_df: pd.DataFrame) -> Optional[go.Figure]:
         ]  # Use announcement date if implementation date is missing
 
     # Convert to datetime, handling any parsing errors by coercing to NaT
-    df["announcement_date"] = pd.to_datetime(df["announcement_date"], errors="coerce")
-    df["implementation_date"] = pd.to_datetime(
-        df["implementation_date"], errors="coerce"
-    )
+    df["announcement_date"] = _parse_dates(df["announcement_date"])
+    df["implementation_date"] = _parse_dates(df["implementation_date"])
 
     # Filter out rows where date conversion failed
     df = df.dropna(subset=["announcement_date"])
 
-    # For rows where implementation_date is NaT, use announcement_date
-    mask = df["implementation_date"].isna()
-    df.loc[mask, "implementation_date"] = df.loc[mask, "announcement_date"]
+    # Compute the final implementation dates as whole columns and assign once
+    announced = df["announcement_date"]
 
-    # For implementation dates before announcement dates, use announcement_date
-    mask = df["implementation_date"] < df["announcement_date"]
-    df.loc[mask, "implementation_date"] = df.loc[mask, "announcement_date"]
+    # For rows where implementation_date is NaT, or before the announcement,
+    # use announcement_date
+    implemented = df["implementation_date"].fillna(announced)
+    implemented = implemented.where(implemented >= announced, announced)
 
     # Add one month to implementation date if it equals announcement date
     # This ensures the timeline bar has sufficient width to be visible
-    mask = df["implementation_date"] == df["announcement_date"]
-    df.loc[mask, "implementation_date"] = df.loc[
-        mask, "announcement_date"
-    ] + pd.DateOffset(months=1)
+    implemented = implemented.mask(
+        implemented == announced, announced + pd.DateOffset(months=1)
+    )
+    df["implementation_date"] = implemented
+
+    # Sort by date for better visualization, keeping only the most recent
+    # events so the figure size stays bounded as the dataset grows
+    df = df.sort_values("announcement_date").tail(max_events)
 
-    # Sort by date for better visualization
-    df = df.sort_values("announcement_date")
+    # Events dropped above may have been the last of their measure type or
+    # imposing country
+    df = _drop_unused_categories(df)
 
     # Get the date range
     min_date = df["announcement_date"].min()
@@ -179,44 +242,26 @@ def create_world_map(
 
     # Print debug info if enabled
     if debug:
-        print(f"Map type: {map_type}")
-        print(f"DataFrame columns: {events_df.columns.tolist()}")
-        print(f"DataFrame shape: {events_df.shape}")
-
-    # Create a copy of the DataFrame to avoid modifying the original
-    df = events_df.copy()
+        print(
+            f"Map type: {map_type}, DataFrame shape: {events_df.shape}, "
+            f"columns: {events_df.columns.tolist()}"
+        )
 
-    # IMPORTANT: We'll use a reliable hard-coded mapping for now to fix the issue
-    # This ensures the app works while we investigate the CSV loading issue
-    iso2_to_iso3 = {
-        "US": "USA",
-        "CA": "CAN",
-        "CN": "CHN",
-        "MX": "MEX",
-        "EU": "EUR",
-        "GB": "GBR",
-        "JP": "JPN",
-        "KR": "KOR",
-        "IN": "IND",
-        "RU": "RUS",
-        "NG": "NGA",
-        "TW": "TWN",
-        "All": "WLD",
-    }
+    iso2_to_iso3 = MAP_ISO2_TO_ISO3
 
     if debug:
-        print(f"Using reliable mapping with {len(iso2_to_iso3)} entries")
+        print(f"Using ISO code mapping with {len(iso2_to_iso3)} entries")
 
     # Select the relevant column based on map type
     if map_type == "imposing":
-        if "imposing_country_code" not in df.columns:
+        if "imposing_country_code" not in events_df.columns:
             if debug:
                 print("No imposing_country_code column found")
             return None
         country_col = "imposing_country_code"
         title = "Countries Imposing Tariffs"
     else:  # targeted
-        if "targeted_country_codes" not in df.columns:
+        if "targeted_country_codes" not in events_df.columns:
             if debug:
                 print("No targeted_country_codes column found")
             return None
@@ -224,32 +269,30 @@ def create_world_map(
         title = "Countries Targeted by Tariffs"
 
     # Process the country codes and count occurrences
-    country_counts = {}
-
-    for idx, row in df.iterrows():
-        codes = row[country_col]
+    country_counts = Counter()
 
-        # Skip empty values
-        if pd.isna(codes) or codes == "":
-            continue
-
-        # Process the codes based on their type
-        code_list = []
+    # Iterate over the single column directly rather than building a row
+    # Series per event with iterrows
+    for codes in events_df[country_col].tolist():
+        # Process the codes based on their type, skipping empty values
         if isinstance(codes, list):
             code_list = codes
         elif isinstance(codes, str):
             # Split by comma and strip whitespace
             code_list = [code.strip() for code in codes.split(",") if code.strip()]
+        else:
+            continue
 
         # Count each code
-        for code in code_list:
-            if code and code.strip():
-                code = code.strip()
-                country_counts[code] = country_counts.get(code, 0) + 1
+        country_counts.update(
+            code.strip() for code in code_list if code and code.strip()
+        )
 
     if debug:
-        print(f"Extracted {len(country_counts)} unique country codes")
-        print(f"Country codes: {list(country_counts.keys())} ...")
+        print(
+            f"Extracted {len(country_counts)} unique country codes: "
+            f"{list(country_counts.keys())}"
+        )
 
     # Check if we have any valid country codes
     if not country_counts:
@@ -259,6 +302,7 @@ def create_world_map(
 
     # Convert country counts to a list of dictionaries for plotting
     plot_data = []
+    unmapped_codes = []
 
     # Process regular countries
     for code, count in country_counts.items():
@@ -270,10 +314,14 @@ def create_world_map(
             plot_data.append(
                 {"country_code": code_key, "count": count, "iso3_code": iso3}
             )
-            if debug:
-                print(f"Added {code_key} → {iso3} with count {count}")
-        elif debug:
-            print(f"No mapping found for code: '{code_key}'")
+        else:
+            unmapped_codes.append(code_key)
+
+    if debug:
+        print(
+            f"Mapped {len(plot_data)} country codes, no mapping found for: "
+            f"{unmapped_codes}"
+        )
 
     # Special handling for EU - represent as member countries
     eu_countries = [
@@ -324,9 +372,10 @@ def create_world_map(
     plot_df = pd.DataFrame(plot_data)
 
     if debug:
-        print(f"Created plot data with {len(plot_df)} entries")
-        if not plot_df.empty:
-            print(f"Sample plot data: {plot_df.head(5).to_dict('records')}")
+        print(
+            f"Created plot data with {len(plot_df)} entries, sample: "
+            f"{plot_df.head(5).to_dict('records')}"
+        )
 
     # Create the choropleth map
     try:
@@ -382,16 +431,13 @@ def create_industry_chart(events_df: pd.DataFrame) -> Optional[go.Figure]:
         return None
 
     # Extract industries from the comma-separated list
-    industries = []
-    for ind_str in events_df["affected_industries"]:
-        if isinstance(ind_str, str) and ind_str:
-            industries.extend([ind.strip() for ind in ind_str.split(",")])
+    industries = split_comma_separated(events_df["affected_industries"])
 
-    if not industries:
+    if industries.empty:
         return None
 
     # Count occurrences of each industry
-    industry_counts = pd.Series(industries).value_counts().reset_index()
+    industry_counts = industries.value_counts().reset_index()
     industry_counts.columns = ["Industry", "Count"]
 
     # Create bar chart
@@ -431,7 +477,11 @@ def create_measure_type_pie(events_df: pd.DataFrame) -> Optional[go.Figure]:
         return None
 
     # Count occurrences of each measure type
-    measure_counts = events_df["measure_type"].value_counts().reset_index()
+    measure_counts = (
+        _drop_unused_categories(events_df[["measure_type"]])["measure_type"]
+        .value_counts()
+        .reset_index()
+    )
     measure_counts.columns = ["Measure Type", "Count"]
 
     # Create pie chart